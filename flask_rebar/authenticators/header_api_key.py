@@ -7,10 +7,10 @@
     :copyright: Copyright 2018 PlanGrid, Inc., see AUTHORS.
     :license: MIT, see LICENSE for details.
 """
-from typing import Dict
+from hashlib import sha256
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from flask import request, g
-from hmac import compare_digest
 
 from flask_rebar import errors, messages
 from flask_rebar.authenticators.base import Authenticator
@@ -43,9 +43,21 @@ class HeaderApiKeyAuthenticator(Authenticator):
 
     def __init__(self, header: str, name: str = "sharedSecret") -> None:
         self.header = header
-        self.keys: Dict[str, str] = {}
+        self._keys = _ApiKeys()
         self.name = name
 
+    @property
+    def keys(self) -> Dict[str, str]:
+        """
+        Application names keyed by their shared secrets. Edits made here
+        (e.g. deleting a revoked key) take effect immediately.
+        """
+        return self._keys
+
+    @keys.setter
+    def keys(self, keys: Mapping[str, str]) -> None:
+        self._keys = _ApiKeys(keys)
+
     @property
     def authenticated_app_name(self) -> str:
         return get_authenticated_app_name()
@@ -60,17 +72,78 @@ class HeaderApiKeyAuthenticator(Authenticator):
         :param str key:
             The shared secret.
         """
-        self.keys[key] = app_name
+        self._keys[key] = app_name
 
     def authenticate(self) -> None:
-        if self.header not in request.headers:
+        token = request.headers.get(self.header)
+        if token is None:
             raise errors.Unauthorized(messages.missing_auth_token)
 
-        token = request.headers[self.header]
-
-        for key, app_name in self.keys.items():
-            if compare_digest(str(token), key):
-                g.authenticated_app_name = app_name
-                break
-        else:
+        # Look the token up by its digest rather than by value. A dict lookup
+        # ends in an == comparison that short-circuits on the first differing
+        # byte, but on digests that reveals nothing about the secrets
+        # themselves, so this stays safe against timing attacks while costing
+        # a single hash regardless of how many keys are registered.
+        app_name = self._keys.get_app_name_for_token(token)
+        if app_name is None:
             raise errors.Unauthorized(messages.invalid_auth_token)
+
+        g.authenticated_app_name = app_name
+
+
+def _digest(key: str) -> bytes:
+    return sha256(key.encode("utf-8")).digest()
+
+
+class _ApiKeys(Dict[str, str]):
+    """
+    Dictionary of shared secrets to application names that also indexes the
+    application names by the digest of each secret, keeping both in sync so
+    every change to the dictionary is seen by authentication.
+    """
+
+    def __init__(self, keys: Optional[Mapping[str, str]] = None) -> None:
+        super().__init__()
+        self._digests: Dict[bytes, str] = {}
+        if keys:
+            self.update(keys)
+
+    def __setitem__(self, key: str, app_name: str) -> None:
+        super().__setitem__(key, app_name)
+        self._digests[_digest(key)] = app_name
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        del self._digests[_digest(key)]
+
+    def __ior__(self, other: Any) -> "_ApiKeys":  # type: ignore[override, misc]
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: str) -> None:
+        for key, app_name in dict(*args, **kwargs).items():
+            self[key] = app_name
+
+    def setdefault(self, key: str, app_name: str) -> str:  # type: ignore[override]
+        if key not in self:
+            self[key] = app_name
+        return self[key]
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key not in self and default:
+            return default[0]
+        app_name = self[key]
+        del self[key]
+        return app_name
+
+    def popitem(self) -> Tuple[str, str]:
+        key, app_name = super().popitem()
+        del self._digests[_digest(key)]
+        return key, app_name
+
+    def clear(self) -> None:
+        super().clear()
+        self._digests.clear()
+
+    def get_app_name_for_token(self, token: str) -> Optional[str]:
+        return self._digests.get(_digest(token))
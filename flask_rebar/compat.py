@@ -1,5 +1,6 @@
 from typing import Any
 from typing import Dict
+from typing import Optional
 
 import marshmallow
 from marshmallow.fields import Field
@@ -22,8 +23,10 @@ def get_data_key(field: Field) -> str:
     return field.name
 
 
-def load(schema: Schema, data: Dict[str, Any]) -> Dict[str, Any]:
-    return schema.load(data)
+def load(
+    schema: Schema, data: Dict[str, Any], unknown: Optional[str] = None
+) -> Dict[str, Any]:
+    return schema.load(data, unknown=unknown)
 
 
 def dump(schema: Schema, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -59,8 +62,3 @@ def dump(schema: Schema, data: Dict[str, Any]) -> Dict[str, Any]:
     else:
         result = schema.dump(data)
     return result
-
-
-def exclude_unknown_fields(schema: Schema) -> Schema:
-    schema.unknown = marshmallow.EXCLUDE
-    return schema
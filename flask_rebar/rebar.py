@@ -13,6 +13,7 @@ import sys
 from collections import defaultdict
 from collections import namedtuple
 from copy import copy
+from functools import partial
 from functools import wraps
 from flask import current_app, g, jsonify, request, Response
 from flask.app import Flask
@@ -65,6 +66,14 @@ from flask_rebar.swagger_ui import create_swagger_ui_blueprint
 MOVED_PERMANENTLY_ERROR = RequestRedirect
 PERMANENT_REDIRECT_ERROR = RequestRedirect
 
+# Upper bound on the number of distinct error bodies cached per app, since
+# error descriptions can be arbitrary strings (e.g. abort(404, description=...))
+MAX_CACHED_ERROR_BODIES = 256
+
+# Upper bound on the number of generated specifications cached per registry.
+# Specifications are cached per request host, which is client controlled.
+MAX_CACHED_SWAGGER_SPECS = 16
+
 # for type hinting decorators
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -133,6 +142,22 @@ def _unpack_view_func_return_value(
     return data, int(status), headers
 
 
+def _authenticate(authenticators: List[Authenticator]) -> None:
+    """
+    Runs the given authenticators in order, succeeding as soon as one of them
+    does and otherwise raising the first error encountered.
+    """
+    first_error = None
+    for authenticator in authenticators:
+        try:
+            authenticator.authenticate()
+            return  # Short-circuit on first successful authentication
+        except (errors.Unauthorized, errors.Forbidden) as e:
+            first_error = first_error or e
+
+    raise first_error or errors.Unauthorized
+
+
 def _wrap_handler(
     f: Callable[P, T],
     authenticators: Optional[List[Authenticator]] = None,
@@ -152,34 +177,56 @@ def _wrap_handler(
     if isinstance(authenticators, Authenticator):
         authenticators = [authenticators]
 
-    @wraps(f)
-    def wrapped(*args: P.args, **kwargs: P.kwargs) -> Union[T, Response]:
-        if authenticators:
-            first_error = None
-            for authenticator in authenticators:
-                try:
-                    authenticator.authenticate()
-                    break  # Short-circuit on first successful authentication
-                except (errors.Unauthorized, errors.Forbidden) as e:
-                    first_error = first_error or e
-            else:
-                raise first_error or errors.Unauthorized
+    # Only the validation steps this handler is configured for are collected,
+    # so requests don't re-check every option on the way in.
+    steps: List[Callable[[], None]] = []
+
+    if authenticators:
+        steps.append(partial(_authenticate, authenticators))
 
-        if query_string_schema:
+    if query_string_schema:
+
+        def validate_args() -> None:
             g.validated_args = get_query_string_params_or_400(
                 schema=query_string_schema
             )
 
-        if request_body_schema:
+        steps.append(validate_args)
+
+    if request_body_schema:
+
+        def validate_body() -> None:
             g.validated_body = get_json_body_params_or_400(schema=request_body_schema)
 
-        if headers_schema:
+        steps.append(validate_body)
+
+    if headers_schema:
+
+        def validate_headers() -> None:
             g.validated_headers = get_header_params_or_400(schema=headers_schema)
 
-        rv: Any = current_app.ensure_sync(f)(*args, **kwargs)
+        steps.append(validate_headers)
 
-        if not response_body_schema:
-            return rv
+    def validate_request() -> None:
+        for step in steps:
+            step()
+
+    # Pick the wrapper flavor once, at registration time, so handlers without
+    # a response schema don't pay for the marshaling branches on every request.
+    if not response_body_schema:
+
+        @wraps(f)
+        def unmarshaled_wrapped(*args: P.args, **kwargs: P.kwargs) -> T:
+            validate_request()
+            return current_app.ensure_sync(f)(*args, **kwargs)
+
+        return unmarshaled_wrapped
+
+    @wraps(f)
+    def wrapped(*args: P.args, **kwargs: P.kwargs) -> Union[T, Response]:
+        validate_request()
+
+        rv: Any = current_app.ensure_sync(f)(*args, **kwargs)
 
         if isinstance(rv, current_app.response_class):
             schema = response_body_schema[rv.status_code]
@@ -379,8 +426,18 @@ class HandlerRegistry:
         elif default_authenticators is None:
             default_authenticators = []
 
+        # Generated specifications, keyed by (generator, host) and stored with
+        # the paths version they were built from. The spec only changes when
+        # the registry does, so there's no need to rebuild it on every request
+        # to the spec endpoint.
+        self._swagger_cache: Dict[
+            Tuple[SwaggerGenerator, str], Tuple[int, Dict[str, Any]]
+        ] = {}
         self.prefix = normalize_prefix(prefix)
-        self._paths: Dict[str, Dict[str, PathDefinition]] = defaultdict(dict)
+        self._paths: Dict[str, Dict[str, PathDefinition]] = {}
+        # Clones share _paths, so they share its version too. It's bumped on
+        # every add_handler so that all of them notice new handlers.
+        self._paths_version = [0]
         self.default_authenticators = default_authenticators
         self.default_headers_schema = default_headers_schema
         self.default_mimetype = default_mimetype
@@ -392,6 +449,13 @@ class HandlerRegistry:
         else:
             self.handlers = handlers if isinstance(handlers, list) else [handlers]
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Settings such as prefix and default_mimetype end up in the generated
+        # spec, and they're commonly assigned directly, e.g. on a clone.
+        if not name.startswith("_"):
+            self._swagger_cache.clear()
+
     @property
     @deprecated("default_authenticators", "3.0")
     def default_authenticator(self) -> Optional[Authenticator]:
@@ -429,7 +493,9 @@ class HandlerRegistry:
 
         :rtype: HandlerRegistry
         """
-        return copy(self)
+        cloned = copy(self)
+        cloned._swagger_cache = {}
+        return cloned
 
     def _prefixed(self, path: str) -> str:
         if self.prefix:
@@ -447,30 +513,24 @@ class HandlerRegistry:
     def paths(self) -> Dict[str, Dict[str, PathDefinition]]:
         # We duplicate the paths so we can modify the path definitions right before
         # they are accessed.
-        paths: Dict[str, Dict[str, PathDefinition]] = defaultdict(dict)
+        paths: Dict[str, Dict[str, PathDefinition]] = {}
 
+        # PathDefinitions are immutable, so they only need to be rebuilt when
+        # there's a prefix to apply. This property is read several times per
+        # swagger generation, so avoid re-creating every definition each time.
         for path, methods in self._paths.items():
-            for method, definition_ in methods.items():
-                path = definition_.path
-
-                if self.prefix:
-                    path = prefix_url(prefix=self.prefix, url=path)
-
-                paths[path][method] = PathDefinition(
-                    func=definition_.func,
-                    path=path,
-                    method=definition_.method,
-                    endpoint=definition_.endpoint,
-                    response_body_schema=definition_.response_body_schema,
-                    query_string_schema=definition_.query_string_schema,
-                    request_body_schema=definition_.request_body_schema,
-                    headers_schema=definition_.headers_schema,
-                    authenticators=definition_.authenticators,
-                    tags=definition_.tags,
-                    mimetype=definition_.mimetype,
-                    hidden=definition_.hidden,
-                    summary=definition_.summary,
+            if self.prefix:
+                path = prefix_url(prefix=self.prefix, url=path)
+                # Rules like "/foos" and "foos" share a prefixed URL, so merge
+                # their methods rather than letting one replace the other.
+                paths.setdefault(path, {}).update(
+                    {
+                        method: definition_._replace(path=path)
+                        for method, definition_ in methods.items()
+                    }
                 )
+            else:
+                paths[path] = dict(methods)
 
         return paths
 
@@ -554,7 +614,7 @@ class HandlerRegistry:
         elif authenticators is None:
             authenticators_list = []
 
-        self._paths[rule][method] = PathDefinition(
+        self._paths.setdefault(rule, {})[method] = PathDefinition(
             func=func,
             path=rule,
             method=method,
@@ -569,6 +629,7 @@ class HandlerRegistry:
             hidden=hidden,
             summary=summary,
         )
+        self._paths_version[0] += 1
 
     @deprecated_parameters(
         authenticator=(
@@ -629,6 +690,14 @@ class HandlerRegistry:
             for handler_mod in find_modules(import_path=handler, recursive=True):
                 import_string(handler_mod)
 
+        # Definitions that share a handler and its configuration (e.g. one
+        # function registered for several methods) share a single wrapper.
+        # Besides avoiding redundant wrappers, this lets them share an
+        # endpoint, since Flask refuses to map one endpoint to different
+        # view functions.
+        wrappers: Dict[Tuple[Any, ...], Callable] = {}
+        rules: Dict[Tuple[str, str, Callable], List[str]] = {}
+
         for path, methods in self.paths.items():
             for method, definition_ in methods.items():
                 if definition_.endpoint:
@@ -646,29 +715,53 @@ class HandlerRegistry:
                     else:
                         authenticators.append(authenticator)
 
-                app.add_url_rule(
-                    rule=definition_.path,
-                    view_func=_wrap_handler(
+                headers_schema = (
+                    self.default_headers_schema
+                    if definition_.headers_schema is USE_DEFAULT
+                    else definition_.headers_schema
+                )
+                mimetype = (
+                    self.default_mimetype
+                    if definition_.mimetype is USE_DEFAULT
+                    else definition_.mimetype
+                )
+                response_body_schema = definition_.response_body_schema
+
+                wrapper_key = (
+                    definition_.func,
+                    tuple(map(id, authenticators)),
+                    id(definition_.query_string_schema),
+                    id(definition_.request_body_schema),
+                    id(headers_schema),
+                    tuple(
+                        (code, id(schema))
+                        for code, schema in (response_body_schema or {}).items()
+                    ),
+                    mimetype,
+                )
+                view_func = wrappers.get(wrapper_key)
+                if view_func is None:
+                    view_func = wrappers[wrapper_key] = _wrap_handler(
                         f=definition_.func,
                         authenticators=authenticators,
                         query_string_schema=definition_.query_string_schema,
                         request_body_schema=definition_.request_body_schema,
-                        headers_schema=(
-                            self.default_headers_schema
-                            if definition_.headers_schema is USE_DEFAULT
-                            else definition_.headers_schema
-                        ),
-                        response_body_schema=definition_.response_body_schema,
-                        mimetype=(
-                            self.default_mimetype
-                            if definition_.mimetype is USE_DEFAULT
-                            else definition_.mimetype
-                        ),
-                    ),
-                    methods=[definition_.method],
-                    endpoint=endpoint,
+                        headers_schema=headers_schema,
+                        response_body_schema=response_body_schema,
+                        mimetype=mimetype,
+                    )
+
+                rules.setdefault((definition_.path, endpoint, view_func), []).append(
+                    definition_.method
                 )
 
+        # Methods that share a path, endpoint and view function are registered
+        # as a single rule, which keeps Werkzeug's URL map small.
+        for (rule, endpoint, view_func), rule_methods in rules.items():
+            app.add_url_rule(
+                rule=rule, view_func=view_func, methods=rule_methods, endpoint=endpoint
+            )
+
     def _register_swagger(self, app: Flask) -> None:
         swagger_endpoint = "get_swagger"
 
@@ -681,9 +774,23 @@ class HandlerRegistry:
                 self._prefixed_spec_path(), methods=["GET"], endpoint=swagger_endpoint
             )
             def get_swagger() -> Response:
-                swagger = self.swagger_generator.generate_swagger(
-                    registry=self, host=request.host_url.rstrip("/")
-                )
+                host = request.host_url.rstrip("/")
+                key = (self.swagger_generator, host)
+                version = self._paths_version[0]
+                cached = self._swagger_cache.get(key)
+                if cached is not None and cached[0] == version:
+                    swagger = cached[1]
+                else:
+                    swagger = self.swagger_generator.generate_swagger(
+                        registry=self, host=host
+                    )
+                    # The host comes from the request, so don't let arbitrary
+                    # Host headers grow the cache without bound.
+                    if (
+                        cached is not None
+                        or len(self._swagger_cache) < MAX_CACHED_SWAGGER_SPECS
+                    ):
+                        self._swagger_cache[key] = (version, swagger)
                 return response(data=swagger)
 
     def _register_swagger_ui(self, app: Flask) -> None:
@@ -866,6 +973,11 @@ class Rebar:
         }
 
     def _init_error_handling(self, app: Flask) -> None:
+        werkzeug_error_bodies: Dict[
+            Tuple[Optional[int], Optional[str]], Tuple[bytes, Optional[str]]
+        ] = {}
+        internal_error_bodies: Dict[Optional[str], Tuple[bytes, Optional[str]]] = {}
+
         @app.errorhandler(errors.HttpJsonError)
         def handle_http_error(error: HttpJsonError) -> Response:
             return self._create_json_error_response(
@@ -878,9 +990,29 @@ class Rebar:
         @app.errorhandler(404)
         @app.errorhandler(405)
         def handle_werkzeug_http_error(error: HTTPException) -> Response:
-            return self._create_json_error_response(
+            # These errors are mostly the same few 404s and 405s over and over,
+            # so cache the serialized bodies instead of re-encoding them each time.
+            # Descriptions can be any JSON-serializable value (e.g.
+            # abort(400, description={...})), so only plain strings are cached.
+            if not isinstance(error.description, str):
+                return self._create_json_error_response(
+                    message=error.description, http_status_code=error.code
+                )
+
+            key = (error.code, error.description)
+            cached = werkzeug_error_bodies.get(key)
+            if cached is not None:
+                body, mimetype = cached
+                return current_app.response_class(
+                    body, status=error.code, mimetype=mimetype
+                )
+
+            resp = self._create_json_error_response(
                 message=error.description, http_status_code=error.code
             )
+            if len(werkzeug_error_bodies) < MAX_CACHED_ERROR_BODIES:
+                werkzeug_error_bodies[key] = (resp.get_data(), resp.mimetype)
+            return resp
 
         @app.errorhandler(MOVED_PERMANENTLY_ERROR)
         @app.errorhandler(PERMANENT_REDIRECT_ERROR)
@@ -893,8 +1025,10 @@ class Rebar:
             )
 
         def run_unhandled_exception_handlers(exception: BaseException) -> None:
-            exc_info = sys.exc_info()
-            current_app.log_exception(exc_info=exc_info)
+            # Build exc_info from the exception itself rather than relying on
+            # sys.exc_info(), which is only populated inside an except block.
+            exc_info = (type(exception), exception, exception.__traceback__)
+            current_app.log_exception(exc_info=exc_info)  # type: ignore
 
             for func in self.uncaught_exception_handlers:
                 func(exception)
@@ -905,10 +1039,22 @@ class Rebar:
 
             if current_app.debug:
                 raise error
-            else:
-                return self._create_json_error_response(
-                    message=messages.internal_server_error, http_status_code=500
-                )
+
+            # The 500 body only varies with the error code attribute, so it's
+            # serialized once per attribute name and reused.
+            cached = internal_error_bodies.get(self.error_code_attr)
+            if cached is not None:
+                body, mimetype = cached
+                return current_app.response_class(body, status=500, mimetype=mimetype)
+
+            resp = self._create_json_error_response(
+                message=messages.internal_server_error, http_status_code=500
+            )
+            internal_error_bodies[self.error_code_attr] = (
+                resp.get_data(),
+                resp.mimetype,
+            )
+            return resp
 
         @app.teardown_request
         def teardown(exception: Optional[BaseException]) -> None:
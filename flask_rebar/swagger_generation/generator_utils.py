@@ -7,9 +7,9 @@
     :copyright: Copyright 2019 PlanGrid, Inc., see AUTHORS.
     :license: MIT, see LICENSE for details.
 """
-import copy
 import re
 from collections import namedtuple, OrderedDict
+from functools import lru_cache
 from typing import (
     overload,
     Any,
@@ -19,7 +19,6 @@ from typing import (
     List,
     Optional,
     Tuple,
-    Set,
     Union,
     TYPE_CHECKING,
 )
@@ -131,7 +130,6 @@ def flatten(schema: Dict[str, Any], base: str) -> Tuple[Dict[str, str], Dict[str
     objects replaces with references, and the second item is the flattened
     definitions dictionary.
     """
-    schema = copy.deepcopy(schema)
     definitions: Dict[str, Any] = {}
     schema = _flatten(schema=schema, definitions=definitions, base=base)
     return schema, definitions
@@ -150,22 +148,29 @@ def _flatten(
 
     subschema_keyword = _get_subschema_keyword(schema)
 
+    # The input schema is never mutated: any level that needs rewriting is
+    # shallow copied, and untouched subtrees are shared with the input.
     if sw.object_ in schema_types:
-        properties = schema.get(sw.properties, {})
-        for key, prop in properties.items():
-            properties[key] = _flatten(schema=prop, definitions=definitions, base=base)
+        properties = schema.get(sw.properties)
+        if properties:
+            schema = dict(schema)
+            schema[sw.properties] = {
+                key: _flatten(schema=prop, definitions=definitions, base=base)
+                for key, prop in properties.items()
+            }
 
     elif sw.array in schema_types:
+        schema = dict(schema)
         schema[sw.items] = _flatten(
             schema=schema[sw.items], definitions=definitions, base=base
         )
 
     elif subschema_keyword:
-        subschemas = schema[subschema_keyword]
-        for i, subschema in enumerate(subschemas):
-            subschemas[i] = _flatten(
-                schema=subschema, definitions=definitions, base=base
-            )
+        schema = dict(schema)
+        schema[subschema_keyword] = [
+            _flatten(schema=subschema, definitions=definitions, base=base)
+            for subschema in schema[subschema_keyword]
+        ]
 
     if sw.title in schema:
         definitions_key = get_key(schema)
@@ -186,6 +191,7 @@ _PATH_REGEX = re.compile("<((?P<type>.+?):)?(?P<name>.+?)>")
 PathArgument = namedtuple("PathArgument", ["name", "type"])
 
 
+@lru_cache(maxsize=512)
 def format_path_for_swagger(path: str) -> Tuple[str, Tuple[PathArgument, ...]]:
     """
     Flask and Swagger represent paths differently - this parses a Flask path
@@ -195,17 +201,22 @@ def format_path_for_swagger(path: str) -> Tuple[str, Tuple[PathArgument, ...]]:
     :param str path:
     :rtype: tuple(str, tuple(_PathArgument))
     """
-    matches = list(_PATH_REGEX.finditer(path))
+    # Paths are rewritten in a single pass over the regex matches, and the
+    # result is cached since a registry only ever has a fixed set of rules.
+    args: List[PathArgument] = []
+    parts: List[str] = []
+    last_end = 0
 
-    args = tuple(
-        PathArgument(name=match.group("name"), type=match.group("type") or "string")
-        for match in matches
-    )
+    for match in _PATH_REGEX.finditer(path):
+        name = match.group("name")
+        args.append(PathArgument(name=name, type=match.group("type") or "string"))
+        start, end = match.span()
+        parts.append(path[last_end:start])
+        parts.append("{" + name + "}")
+        last_end = end
 
-    subbed_path = _PATH_REGEX.sub(
-        repl=lambda match: "{{{}}}".format(match.group("name")), string=path
-    )
-    return subbed_path, args
+    parts.append(path[last_end:])
+    return "".join(parts), tuple(args)
 
 
 def verify_parameters_are_the_same(
@@ -277,19 +288,22 @@ def get_unique_schema_definitions(
     return flattened
 
 
-def get_unique_authenticators(registry: "HandlerRegistry") -> Set[Authenticator]:
-    authenticators = {
-        authenticator
-        for d in iterate_path_definitions(paths=registry.paths)
-        for authenticator in d.authenticators
-        if authenticator is not None and authenticator is not USE_DEFAULT
-    }
+def get_unique_authenticators(registry: "HandlerRegistry") -> List[Authenticator]:
+    # Keyed by identity rather than put in a set, so authenticators don't need
+    # to be hashable and come out in a stable order (the order they were
+    # registered in, followed by the registry's defaults).
+    authenticators: Dict[int, Authenticator] = {}
+
+    for d in iterate_path_definitions(paths=registry.paths):
+        for authenticator in d.authenticators:
+            if authenticator is not None and authenticator is not USE_DEFAULT:
+                authenticators.setdefault(id(authenticator), authenticator)
 
     for authenticator in registry.default_authenticators:
         if authenticator is not None:
-            authenticators.add(authenticator)
+            authenticators.setdefault(id(authenticator), authenticator)
 
-    return authenticators
+    return list(authenticators.values())
 
 
 def iterate_path_definitions(
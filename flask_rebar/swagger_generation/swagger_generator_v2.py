@@ -7,7 +7,6 @@
     :copyright: Copyright 2019 PlanGrid, Inc., see AUTHORS.
     :license: MIT, see LICENSE for details.
 """
-import copy
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence
 
 from marshmallow import Schema
@@ -361,7 +360,8 @@ class SwaggerV2Generator(SwaggerGenerator):
         required = obj.get("required", [])
 
         for name, prop in sorted(obj["properties"].items(), key=lambda i: i[0]):
-            parameter = copy.deepcopy(prop)
+            # Only top level keys are added, so a shallow copy is enough
+            parameter = dict(prop)
             parameter["required"] = name in required
             parameter["in"] = in_
             parameter["name"] = name
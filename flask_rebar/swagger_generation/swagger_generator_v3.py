@@ -140,7 +140,8 @@ class SwaggerV3Generator(SwaggerGenerator):
         if self.tags:
             swagger[sw.tags] = [tag.as_swagger() for tag in self.tags]
 
-        servers = self.servers or []
+        # Copy so the host added below doesn't leak into later calls
+        servers = list(self.servers or [])
 
         if host:
             servers.append(Server(url=host))
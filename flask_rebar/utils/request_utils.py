@@ -8,7 +8,6 @@
     :license: MIT, see LICENSE for details.
 """
 import collections
-import copy
 from typing import Any
 from typing import Dict
 from typing import Iterator
@@ -108,6 +107,13 @@ def marshal(data: Any, schema: Schema) -> Dict[str, Any]:
     return compat.dump(schema=schema, data=data)
 
 
+# Instances created by normalize_schema for bare Schema classes. Each instance
+# keeps its class alive, so the cache is bounded in case classes are created
+# at runtime.
+MAX_CACHED_SCHEMA_INSTANCES = 256
+_schema_instances: Dict[Type[Schema], Schema] = {}
+
+
 @overload
 def normalize_schema(schema: None) -> None:
     ...
@@ -139,7 +145,11 @@ def normalize_schema(
     - None -> return None
     - USE_DEFAULT -> return USE_DEFAULT
     """
-    if schema not in (None, USE_DEFAULT) and not isinstance(schema, marshmallow.Schema):
+    # Handlers are registered with schema instances, so this is the common case
+    # when normalizing per request.
+    if isinstance(schema, marshmallow.Schema):
+        return schema
+    if schema is not None and schema is not USE_DEFAULT:
         # See if we were handed a marshmallow_objects Model class or instance:
         mo_schema = get_marshmallow_objects_schema(schema)
         if mo_schema:
@@ -149,8 +159,21 @@ def normalize_schema(
             if hasattr(model, "__swagger_title__"):
                 schema.__swagger_title__ = model.__swagger_title__
         else:
-            # assume we were passed a Schema class (not an instance)
-            schema = schema()
+            # assume we were passed a Schema class (not an instance), and
+            # reuse one instance per class rather than building a new one on
+            # every call
+            instance = _schema_instances.get(schema)
+            if instance is None:
+                instance = schema()
+                # Classes that opt out of marshmallow's class registry (like
+                # those built by Schema.from_dict) are typically throwaway,
+                # so don't keep them alive either.
+                if (
+                    instance.opts.register
+                    and len(_schema_instances) < MAX_CACHED_SCHEMA_INSTANCES
+                ):
+                    _schema_instances[schema] = instance
+            schema = instance
     return schema
 
 
@@ -167,11 +190,7 @@ def raise_400_for_marshmallow_errors(
     if not errs:
         raise errors.BadRequest(msg=msg)
 
-    copied = copy.deepcopy(errs)
-
-    _format_marshmallow_errors_for_response_in_place(copied)
-
-    additional_data = {"errors": copied}
+    additional_data = {"errors": _format_marshmallow_errors_for_response(errs)}
 
     raise errors.BadRequest(msg=msg, additional_data=additional_data)
 
@@ -212,20 +231,26 @@ def get_query_string_params_or_400(schema: Schema) -> Dict[str, Any]:
 
 
 def get_header_params_or_400(schema: Schema) -> Dict[str, Any]:
-    schema = compat.exclude_unknown_fields(schema)
+    # Requests carry plenty of headers a schema doesn't care about. These are
+    # excluded per load rather than by changing the schema's own setting, as
+    # schema instances may be shared with other uses.
     return _get_data_or_400(
         schema=schema,
         data=HeadersProxy(request.headers),
         message=messages.header_validation_failed,
+        unknown=marshmallow.EXCLUDE,
     )
 
 
 def _get_data_or_400(
-    schema: Schema, data: Any, message: messages.ErrorMessage
+    schema: Schema,
+    data: Any,
+    message: messages.ErrorMessage,
+    unknown: Optional[str] = None,
 ) -> Dict[str, Any]:
     schema = normalize_schema(schema)
     try:
-        return compat.load(schema=schema, data=data)
+        return compat.load(schema=schema, data=data, unknown=unknown)
     except marshmallow.ValidationError as e:
         raise_400_for_marshmallow_errors(errs=e.messages_dict, msg=message)
 
@@ -235,15 +260,16 @@ def _get_json_body_or_400() -> Union[List[Any], Dict[str, Any]]:
     Retrieves the JSON payload of the current request, throwing a 400 error
     if the request doesn't include a valid JSON payload.
     """
-    if "application/json" not in request.headers.get("content-type", ""):
+    if not request.headers.get("content-type", "").startswith("application/json"):
         raise errors.BadRequest(messages.unsupported_content_type)
 
-    if (not request.data) or (len(request.data) == 0):
-        raise errors.BadRequest(messages.empty_json_body)
-
+    # Parse once, and only work out why that failed (empty payload vs.
+    # malformed JSON) on the error path.
     try:
         body = request.get_json()
     except WerkzeugBadRequest:
+        if not request.get_data(cache=True):
+            raise errors.BadRequest(messages.empty_json_body)
         raise errors.BadRequest(messages.invalid_json)
 
     if not isinstance(body, list) and not isinstance(body, dict):
@@ -255,26 +281,35 @@ def _get_json_body_or_400() -> Union[List[Any], Dict[str, Any]]:
     return body
 
 
-def _format_marshmallow_errors_for_response_in_place(errs: Dict[str, Any]) -> None:
+def _format_marshmallow_errors_for_response(errs: Dict[str, Any]) -> Dict[str, Any]:
     """
     Reformats an error dictionary returned by marshmallow to an error
     dictionary we can send in a response.
 
-    This transformation happens in place, so make sure to pass in a copy
-    of the errors...
+    This builds a new dictionary, leaving the marshmallow errors untouched.
     """
-    # These are errors on the entire schema, not a specific field
-    # Let's rename these too something slightly less cryptic
-    if "_schema" in errs:
-        errs["_general"] = errs.pop("_schema")
+    formatted = {}
 
     for field, value in errs.items():
+        # These are errors on the entire schema, not a specific field.
+        # They're added last, under a slightly less cryptic name.
+        if field != "_schema":
+            formatted[field] = _format_marshmallow_error_for_response(value)
+
+    if "_schema" in errs:
+        formatted["_general"] = _format_marshmallow_error_for_response(errs["_schema"])
+
+    return formatted
+
+
+def _format_marshmallow_error_for_response(value: Any) -> Any:
+    if isinstance(value, list):
         # In most cases we'll only have a single error for a field,
         # but marshmallow gives us a list regardless.
         # Let's try to reduce the complexity of the error response and convert
         # these lists to a single string.
-        if isinstance(value, list) and len(value) == 1:
-            errs[field] = value[0]
-        elif isinstance(value, dict):
-            # Recurse! Down the rabbit hole...
-            _format_marshmallow_errors_for_response_in_place(value)
+        return value[0] if len(value) == 1 else list(value)
+    elif isinstance(value, dict):
+        # Recurse! Down the rabbit hole...
+        return _format_marshmallow_errors_for_response(value)
+    return value
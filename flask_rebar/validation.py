@@ -8,7 +8,8 @@
     :license: MIT, see LICENSE for details.
 """
 from collections import namedtuple
-from typing import Any, List, Optional, Mapping, Union
+from typing import Any, Dict, List, Optional, Mapping, Set, Tuple, Union
+from weakref import WeakKeyDictionary
 
 from marshmallow import Schema
 from marshmallow import fields
@@ -17,6 +18,31 @@ from werkzeug.datastructures import MultiDict
 FilterResult = namedtuple("FilterResult", "loadable, dump_only")
 
 
+# Per schema instance metadata used by filter_dump_only, which is called for every
+# item (and nested item) of every validated dump
+_dump_only_metadata: "WeakKeyDictionary[Schema, Tuple[Dict[str, str], Set[str]]]" = (
+    WeakKeyDictionary()
+)
+
+
+def _get_dump_only_metadata(schema: Schema) -> Tuple[Dict[str, str], Set[str]]:
+    metadata = _dump_only_metadata.get(schema)
+    if metadata is None:
+        # Note as of marshmallow 3.13.0, Schema.dump_only is NOT populated if fields are declared as dump_only inline,
+        # so we'll calculate "dump_only" ourselves.  ref: https://github.com/marshmallow-code/marshmallow/issues/1857
+        output_to_input_keys = {
+            field.data_key: key
+            for key, field in schema.fields.items()
+            if field.data_key
+        }
+        dump_only_fields = schema.dump_fields.keys() - schema.load_fields.keys()
+        metadata = _dump_only_metadata[schema] = (
+            output_to_input_keys,
+            dump_only_fields,
+        )
+    return metadata
+
+
 def filter_dump_only(
     schema: Schema, data: Union[Mapping[str, Any], List[Mapping[str, Any]]]
 ) -> FilterResult:
@@ -26,12 +52,7 @@ def filter_dump_only(
     :param data: Mapping or List of Mappings with data
     :return: FilterResult
     """
-    # Note as of marshmallow 3.13.0, Schema.dump_only is NOT populated if fields are declared as dump_only inline,
-    # so we'll calculate "dump_only" ourselves.  ref: https://github.com/marshmallow-code/marshmallow/issues/1857
-    output_to_input_keys = {
-        field.data_key: key for key, field in schema.fields.items() if field.data_key
-    }
-    dump_only_fields = schema.dump_fields.keys() - schema.load_fields.keys()
+    output_to_input_keys, dump_only_fields = _get_dump_only_metadata(schema)
     if isinstance(data, Mapping):
         dump_only = dict()
         non_dump_only = dict()
@@ -106,7 +127,7 @@ class CommaSeparatedList(fields.List):
         items = super()._serialize(value, attr, obj)
         if items is None:
             return None
-        return ",".join([str(i) for i in items])
+        return ",".join(map(str, items))
 
 
 class QueryParamList(fields.List):
@@ -7,11 +7,15 @@
     :copyright: Copyright 2019 PlanGrid, Inc., see AUTHORS.
     :license: MIT, see LICENSE for details.
 """
+import copy
 import unittest
 
+from flask_rebar import HeaderApiKeyAuthenticator
+from flask_rebar import Rebar
 from flask_rebar.swagger_generation.generator_utils import PathArgument
 from flask_rebar.swagger_generation.generator_utils import flatten
 from flask_rebar.swagger_generation.generator_utils import format_path_for_swagger
+from flask_rebar.swagger_generation.generator_utils import get_unique_authenticators
 
 
 class TestFlatten(unittest.TestCase):
@@ -229,6 +233,20 @@ class TestFlatten(unittest.TestCase):
         self.assertEqual(schema, expected_schema)
         self.assertEqual(definitions, expected_definitions)
 
+    def test_flatten_does_not_mutate_input(self):
+        input_ = {
+            "type": "object",
+            "title": "x",
+            "properties": {
+                "a": {"type": "array", "items": {"type": "object", "title": "y"}},
+                "b": {"anyOf": [{"type": "object", "title": "z"}]},
+            },
+        }
+        original = copy.deepcopy(input_)
+
+        flatten(input_, base="#/definitions")
+        self.assertEqual(input_, original)
+
 
 class TestFormatPathForSwagger(unittest.TestCase):
     def test_format_path(self):
@@ -251,3 +269,26 @@ class TestFormatPathForSwagger(unittest.TestCase):
 
         self.assertEqual(res, "/health")
         self.assertEqual(args, tuple())
+
+
+class TestGetUniqueAuthenticators(unittest.TestCase):
+    def test_authenticators_are_unique_and_ordered(self):
+        class UnhashableAuthenticator(HeaderApiKeyAuthenticator):
+            __hash__ = None
+
+        first = UnhashableAuthenticator(header="x-first", name="first")
+        second = HeaderApiKeyAuthenticator(header="x-second", name="second")
+
+        registry = Rebar().create_handler_registry()
+        registry.set_default_authenticator(first)
+        registry.add_handler(
+            func=lambda: None, rule="/foos", method="GET", authenticators=[second]
+        )
+        registry.add_handler(
+            func=lambda: None,
+            rule="/foos",
+            method="POST",
+            authenticators=[first, second],
+        )
+
+        self.assertEqual(get_unique_authenticators(registry), [second, first])
@@ -199,6 +199,22 @@ def test_swagger_v3_generator_non_registry_parameters():
     _assert_dicts_equal(swagger, expected_swagger)
 
 
+def test_swagger_v3_generator_host_is_not_kept_between_calls():
+    generator = SwaggerV3Generator(servers=[Server(url="https://api.example.com")])
+
+    rebar = Rebar()
+    registry = rebar.create_handler_registry()
+
+    generator.generate(registry, host="http://first.example.com")
+    swagger = generator.generate(registry, host="http://second.example.com")
+
+    assert [server["url"] for server in swagger["servers"]] == [
+        "https://api.example.com",
+        "http://second.example.com",
+    ]
+    assert len(generator.servers) == 1
+
+
 @pytest.mark.parametrize("generator", [SwaggerV2Generator(), SwaggerV3Generator()])
 def test_path_parameter_types_must_be_the_same_for_same_path(generator):
     rebar = Rebar()
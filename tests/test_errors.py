@@ -10,7 +10,7 @@
 import json
 import unittest
 
-from flask import Flask
+from flask import Flask, abort
 from marshmallow import fields
 from werkzeug.exceptions import BadRequest
 from unittest.mock import ANY
@@ -21,6 +21,7 @@ from flask_rebar import messages, validation, response, Rebar
 from flask_rebar import errors
 from flask_rebar.utils.request_utils import get_json_body_params_or_400
 from flask_rebar.utils.request_utils import get_query_string_params_or_400
+from flask_rebar.utils.request_utils import raise_400_for_marshmallow_errors
 
 
 class TestErrors(unittest.TestCase):
@@ -53,6 +54,10 @@ class TestErrors(unittest.TestCase):
         def validation_fails_handler():
             raise BadRequest()
 
+        @app.route("/structured_bad_request", methods=["GET"])
+        def a_structured_handler():
+            abort(400, description={"field": ["bad"]})
+
         @app.route("/slow", methods=["GET"])
         def a_slow_handler():
             raise SystemExit()
@@ -99,6 +104,13 @@ class TestErrors(unittest.TestCase):
             resp.json.get("message")
         )  # don't care about exact message wording, just existence
 
+    def test_400_errors_with_structured_descriptions(self):
+        for _ in range(2):
+            resp = self.app.test_client().get("/structured_bad_request")
+            self.assertEqual(resp.status_code, 400)
+            self.assertEqual(resp.content_type, "application/json")
+            self.assertEqual(resp.json, {"message": {"field": ["bad"]}})
+
     def test_default_404_errors_are_formatted_correctly(self):
         resp = self.app.test_client().get("/nonexistent")
         self.assertEqual(resp.status_code, 404)
@@ -107,6 +119,13 @@ class TestErrors(unittest.TestCase):
             resp.json.get("message")
         )  # don't care about exact message wording, just existence
 
+    def test_repeated_404_errors_are_formatted_consistently(self):
+        first = self.app.test_client().get("/nonexistent")
+        second = self.app.test_client().get("/also_nonexistent")
+        self.assertEqual(second.status_code, 404)
+        self.assertEqual(second.content_type, "application/json")
+        self.assertEqual(second.json, first.json)
+
     def test_default_405_errors_are_formatted_correctly(self):
         resp = self.app.test_client().put("/errors")
         self.assertEqual(resp.status_code, 405)
@@ -121,6 +140,20 @@ class TestErrors(unittest.TestCase):
         self.assertEqual(resp.content_type, "application/json")
         self.assertEqual(resp.json, messages.internal_server_error._asdict())
 
+    def test_repeated_500_errors_are_formatted_consistently(self):
+        first = self.app.test_client().get("/uncaught_errors")
+        second = self.app.test_client().get("/uncaught_errors")
+        self.assertEqual(second.status_code, 500)
+        self.assertEqual(second.content_type, "application/json")
+        self.assertEqual(second.json, first.json)
+
+        rebar = self.app.extensions["rebar"]["instance"]
+        rebar.error_code_attr = None
+        resp = self.app.test_client().get("/uncaught_errors")
+        expected = messages.internal_server_error._asdict()
+        expected.pop("rebar_error_code")
+        self.assertEqual(resp.json, expected)
+
     def test_timeouts_log_exceptions(self):
         # in the wild, gunicorn or nginx will cutoff the wsgi server and return a 502
         # causing the wsgi server to raise SystemExit
@@ -132,6 +165,16 @@ class TestErrors(unittest.TestCase):
                 "Exception on /slow [GET]", exc_info=ANY
             )
 
+    def test_uncaught_errors_are_logged_with_traceback(self):
+        with patch.object(self.app, "log_exception") as mock_log_exception:
+            self.app.test_client().get("/uncaught_errors")
+
+        exc_type, exc_value, exc_tb = mock_log_exception.call_args.kwargs["exc_info"]
+        self.assertIs(exc_type, ArithmeticError)
+        self.assertIsInstance(exc_value, ArithmeticError)
+        self.assertIs(exc_tb, exc_value.__traceback__)
+        self.assertIsNotNone(exc_tb)
+
 
 class TestJsonBodyValidation(unittest.TestCase):
     def setUp(self):
@@ -250,6 +293,23 @@ class TestJsonBodyValidation(unittest.TestCase):
 
         self.assertEqual(resp.json, expected)
 
+    def test_schema_errors_are_reported_as_general_errors(self):
+        errs = {"_schema": ["Bad foos."], "foo": ["Too big.", "Too odd."]}
+
+        with self.assertRaises(errors.BadRequest) as ctx:
+            raise_400_for_marshmallow_errors(
+                errs=errs, msg=messages.body_validation_failed
+            )
+
+        self.assertEqual(
+            ctx.exception.additional_data,
+            {"errors": {"foo": ["Too big.", "Too odd."], "_general": "Bad foos."}},
+        )
+        # The marshmallow errors themselves are left untouched
+        self.assertEqual(
+            errs, {"_schema": ["Bad foos."], "foo": ["Too big.", "Too odd."]}
+        )
+
     def test_invalid_json_error(self):
         resp = self.app.test_client().post(
             path="/stuffs",
@@ -10,6 +10,7 @@
 import asyncio
 import json
 import unittest
+from unittest.mock import patch
 
 import marshmallow as m
 import marshmallow_objects as mo
@@ -204,6 +205,67 @@ class RebarTest(unittest.TestCase):
         )
         self.assertEqual(resp.status_code, 401)
 
+    def test_authentication_with_non_ascii_token(self):
+        rebar = Rebar()
+        registry = rebar.create_handler_registry()
+        register_default_authenticator(registry)
+        register_endpoint(registry)
+        app = create_rebar_app(rebar)
+
+        resp = app.test_client().get(
+            path="/foos/1", headers=auth_headers(secret="SÉCRET!")
+        )
+        self.assertEqual(resp.status_code, 401)
+
+    def test_authentication_follows_changes_to_keys(self):
+        rebar = Rebar()
+        registry = rebar.create_handler_registry()
+        authenticator = HeaderApiKeyAuthenticator(header=DEFAULT_AUTH_HEADER)
+        authenticator.register_key(key="old")
+        registry.set_default_authenticator(authenticator)
+        register_endpoint(registry)
+        app = create_rebar_app(rebar)
+
+        # Revoke one key and rotate in another by editing keys directly
+        del authenticator.keys["old"]
+        authenticator.keys["new"] = "default"
+
+        resp = app.test_client().get(path="/foos/1", headers=auth_headers(secret="old"))
+        self.assertEqual(resp.status_code, 401)
+        resp = app.test_client().get(path="/foos/1", headers=auth_headers(secret="new"))
+        self.assertEqual(resp.status_code, 200)
+
+        # Replacing keys altogether takes effect as well
+        authenticator.keys = {"newer": "default"}
+
+        resp = app.test_client().get(path="/foos/1", headers=auth_headers(secret="new"))
+        self.assertEqual(resp.status_code, 401)
+        resp = app.test_client().get(
+            path="/foos/1", headers=auth_headers(secret="newer")
+        )
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(authenticator.keys, {"newer": "default"})
+
+        # As do the other dict methods
+        authenticator.keys.update(newest="default")
+        authenticator.keys.pop("newer")
+        resp = app.test_client().get(
+            path="/foos/1", headers=auth_headers(secret="newer")
+        )
+        self.assertEqual(resp.status_code, 401)
+        resp = app.test_client().get(
+            path="/foos/1", headers=auth_headers(secret="newest")
+        )
+        self.assertEqual(resp.status_code, 200)
+
+    def test_authenticator_keys_is_a_dict(self):
+        authenticator = HeaderApiKeyAuthenticator(header=DEFAULT_AUTH_HEADER)
+        authenticator.register_key(key="secret", app_name="app")
+
+        self.assertIsInstance(authenticator.keys, dict)
+        self.assertIs(type(authenticator.keys.copy()), dict)
+        self.assertEqual(json.loads(json.dumps(authenticator.keys)), {"secret": "app"})
+
     def test_override_authenticator(self):
         auth_header = "x-overridden-auth"
         auth_secret = "BLAM!"
@@ -542,6 +604,48 @@ class RebarTest(unittest.TestCase):
 
         validate_swagger(resp.json)
 
+    def test_swagger_endpoint_caches_generated_spec(self):
+        rebar = Rebar()
+        registry = rebar.create_handler_registry()
+        register_endpoint(registry)
+        app = create_rebar_app(rebar)
+
+        with patch.object(
+            registry.swagger_generator,
+            "generate_swagger",
+            wraps=registry.swagger_generator.generate_swagger,
+        ) as generate_swagger:
+            first = app.test_client().get("/swagger")
+            second = app.test_client().get("/swagger")
+            self.assertEqual(generate_swagger.call_count, 1)
+            self.assertEqual(first.json, second.json)
+
+            # Changing the registry invalidates the cached spec
+            register_endpoint(registry, path="/bars/<foo_uid>", endpoint="bar")
+            resp = app.test_client().get("/swagger")
+            self.assertEqual(generate_swagger.call_count, 2)
+            self.assertIn("/bars/{foo_uid}", resp.json["paths"])
+
+            # So does assigning a setting directly
+            registry.default_mimetype = "text/plain"
+            app.test_client().get("/swagger")
+            self.assertEqual(generate_swagger.call_count, 3)
+
+    def test_swagger_cache_sees_handlers_added_to_a_clone(self):
+        rebar = Rebar()
+        registry = rebar.create_handler_registry()
+        register_endpoint(registry, path="/x", endpoint="x")
+        app = create_rebar_app(rebar)
+
+        self.assertIn("/x", get_swagger(test_client=app.test_client())["paths"])
+
+        # Clones share their paths with the original registry
+        cloned = registry.clone()
+        register_endpoint(cloned, path="/y", endpoint="y")
+
+        swagger = get_swagger(test_client=app.test_client())
+        self.assertEqual(set(swagger["paths"]), set(registry.paths))
+
     def test_swagger_ui_endpoint_is_automatically_created(self):
         rebar = Rebar()
         rebar.create_handler_registry()
@@ -628,6 +732,33 @@ class RebarTest(unittest.TestCase):
         self.assertIn("get", swagger["paths"]["/foos/{foo_uid}"])
         self.assertIn("patch", swagger["paths"]["/foos/{foo_uid}"])
 
+    def test_register_multiple_methods_with_shared_endpoint(self):
+        rebar = Rebar()
+        registry = rebar.create_handler_registry()
+
+        common_kwargs = {
+            "rule": "/foos/<foo_uid>",
+            "response_body_schema": {200: FooSchema()},
+        }
+
+        @registry.handles(method="GET", **common_kwargs)
+        @registry.handles(method="PATCH", **common_kwargs)
+        def handler_func(foo_uid):
+            return DEFAULT_RESPONSE
+
+        app = create_rebar_app(rebar)
+
+        resp = app.test_client().get(path="/foos/1")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json, DEFAULT_RESPONSE)
+
+        resp = app.test_client().patch(path="/foos/1")
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json, DEFAULT_RESPONSE)
+
+        (rule,) = app.url_map.iter_rules(endpoint="handler_func")
+        self.assertTrue({"GET", "PATCH"}.issubset(rule.methods))
+
     @parametrize(
         "headers_def, use_model", [(HeadersSchema(), False), (HeadersModel, True)]
     )
@@ -717,6 +848,32 @@ class RebarTest(unittest.TestCase):
             resp = app.test_client().get(prefix_url(prefix=prefix, url="/foos/1"))
             self.assertEqual(resp.status_code, 200)
 
+    def test_prefixed_rules_with_the_same_url_are_merged(self):
+        app = Flask(__name__)
+        app.testing = True
+
+        rebar = Rebar()
+        registry = rebar.create_handler_registry(prefix="v1")
+
+        # Both rules prefix to /v1/foos
+        register_endpoint(
+            registry=registry, path="/foos", method="GET", endpoint="get_foos"
+        )
+        register_endpoint(
+            registry=registry, path="foos", method="POST", endpoint="create_foo"
+        )
+
+        rebar.init_app(app)
+
+        self.assertEqual(set(registry.paths["/v1/foos"]), {"GET", "POST"})
+
+        for method in ("get", "post"):
+            resp = getattr(app.test_client(), method)("/v1/foos")
+            self.assertEqual(resp.status_code, 200)
+
+        swagger = get_swagger(test_client=app.test_client(), prefix="v1")
+        self.assertEqual(set(swagger["paths"]["/v1/foos"]), {"get", "post"})
+
     def test_clone_rebar(self):
         rebar = Rebar()
         app = Flask(__name__)
@@ -11,9 +11,12 @@ import unittest
 from tests.helpers import make_test_response
 
 from flask import Flask
-from marshmallow import fields, ValidationError
+from marshmallow import Schema, fields, ValidationError
 
 from flask_rebar import validation, response, marshal
+from flask_rebar.utils import request_utils
+from flask_rebar.utils.request_utils import get_header_params_or_400
+from flask_rebar.utils.request_utils import normalize_schema
 
 
 class TestResponseFormatting(unittest.TestCase):
@@ -77,3 +80,36 @@ class TestMarshal(unittest.TestCase):
     def test_marshal_errors(self):
         with self.assertRaises(ValidationError):
             marshal(data={"foo": "bar"}, schema=SchemaForMarshaling)
+
+
+class TestNormalizeSchema(unittest.TestCase):
+    def test_schema_classes_are_instantiated_once(self):
+        schema = normalize_schema(SchemaForMarshaling)
+        self.assertIsInstance(schema, SchemaForMarshaling)
+        self.assertIs(normalize_schema(SchemaForMarshaling), schema)
+
+    def test_unregistered_schema_classes_are_not_cached(self):
+        schema_cls = Schema.from_dict({"foo": fields.Integer()})
+
+        first = normalize_schema(schema_cls)
+        self.assertIsInstance(first, schema_cls)
+        self.assertIsNot(normalize_schema(schema_cls), first)
+        self.assertNotIn(schema_cls, request_utils._schema_instances)
+
+    def test_schema_instances_are_returned_as_is(self):
+        schema = SchemaForMarshaling()
+        self.assertIs(normalize_schema(schema), schema)
+
+
+class TestHeaderParams(unittest.TestCase):
+    def test_unknown_headers_are_excluded_without_changing_the_schema(self):
+        class HeadersSchema(validation.RequestSchema):
+            foo = fields.String(data_key="X-Foo")
+
+        schema = HeadersSchema()
+        app = Flask(__name__)
+
+        with app.test_request_context(headers={"X-Foo": "bar", "X-Bar": "baz"}):
+            self.assertEqual(get_header_params_or_400(schema=schema), {"foo": "bar"})
+
+        self.assertEqual(schema.unknown, HeadersSchema().unknown)